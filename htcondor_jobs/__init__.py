@@ -17,7 +17,6 @@ import logging as _logging
 
 # SET UP NULL LOG HANDLER
 logger = _logging.getLogger(__name__)
-logger.setLevel(_logging.DEBUG)
 logger.addHandler(_logging.NullHandler())
 
 from .handles import Handle, ConstraintHandle, ClusterHandle
@@ -13,14 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union, Iterator, MutableMapping, Mapping, Optional
+from typing import (
+    Union,
+    Iterator,
+    MutableMapping,
+    Mapping,
+    Optional,
+    Any,
+    KeysView,
+    ValuesView,
+    ItemsView,
+)
 import logging
 
 import htcondor
 import classad
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 T_SUBMIT_VALUE = Union[str, int, float, bool, classad.ExprTree]
 
@@ -36,7 +45,7 @@ class SubmitDescription(MutableMapping[str, T_SUBMIT_VALUE]):
     as well as the ``[]`` operator for both getting and setting.
     """
 
-    __slots__ = ("_descriptors",)
+    __slots__ = ("_descriptors", "_str")
 
     def __init__(
         self, mapping: Optional[Mapping] = None, **descriptors: T_SUBMIT_VALUE
@@ -52,26 +61,55 @@ class SubmitDescription(MutableMapping[str, T_SUBMIT_VALUE]):
         """
         if mapping is None:
             mapping = {}
-        self._descriptors = dict(mapping, **descriptors)
+        self._descriptors = {**mapping, **descriptors}
+
+        # rendered submit text, cleared whenever the descriptors change
+        self._str: Optional[str] = None
 
     def __getitem__(self, key: str) -> T_SUBMIT_VALUE:
         return self._descriptors[key]
 
     def __setitem__(self, key: str, value: T_SUBMIT_VALUE) -> None:
         self._descriptors[key] = value
+        self._str = None
 
     def __delitem__(self, key: str) -> None:
         del self._descriptors[key]
+        self._str = None
 
     def __iter__(self) -> Iterator[str]:
-        yield from self._descriptors.keys()
+        return iter(self._descriptors)
 
     def __len__(self) -> int:
         return len(self._descriptors)
 
+    # the MutableMapping mixins work through the methods above one key at a time,
+    # so delegate the commonly-used ones straight to the underlying dict
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._descriptors
+
+    def keys(self) -> KeysView[str]:
+        return self._descriptors.keys()
+
+    def values(self) -> ValuesView[T_SUBMIT_VALUE]:
+        return self._descriptors.values()
+
+    def items(self) -> ItemsView[str, T_SUBMIT_VALUE]:
+        return self._descriptors.items()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._descriptors.get(key, default)
+
+    def update(self, *args: Any, **kwargs: T_SUBMIT_VALUE) -> None:
+        self._descriptors.update(*args, **kwargs)
+        self._str = None
+
     def __str__(self) -> str:
-        # todo: must get quoting rules right
-        return "\n".join(f"{k} = {v}" for k, v in self.items())
+        if self._str is None:
+            # todo: must get quoting rules right
+            self._str = "\n".join([f"{k} = {v}" for k, v in self._descriptors.items()])
+        return self._str
 
     def as_submit(self) -> htcondor.Submit:
         """
@@ -13,13 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional, Union, Iterator, Any, Callable
+from typing import (
+    List,
+    Optional,
+    Union,
+    Iterator,
+    Iterable,
+    Any,
+    Callable,
+    Mapping,
+    Dict,
+    Type,
+)
 import logging
 
-import abc
 import time
+import functools
 from pathlib import Path
+import json
 import pickle
+import warnings
 
 import htcondor
 import classad
@@ -27,23 +40,52 @@ import classad
 from . import locate, status, utils, exceptions
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
+T_EDIT_VALUE = Union[str, int, float, classad.ExprTree]
 
-class Handle(abc.ABC, utils.SlotPickleMixin):
+# an empty projection asks for every attribute; xquery only reads it, so it can be shared
+_ALL_ATTRIBUTES: List[str] = []
+
+_DEFAULT_QUERY_OPTS = htcondor.QueryOpts.Default
+
+
+class Handle(utils.SlotPickleMixin):
     """
     A connection to a set of jobs defined by a constraint.
     The handle can be used to query, act on, or edit those jobs.
     """
 
-    __slots__ = ("collector", "scheduler", "__weakref__")
+    __slots__ = ("_collector", "_scheduler", "_hash", "__weakref__")
 
     def __init__(
         self, collector: Optional[str] = None, scheduler: Optional[str] = None
     ):
+        # computed lazily, because subclasses may not have set up their constraint yet
+        self._hash: Optional[int] = None
+
         self.collector = collector
         self.scheduler = scheduler
 
+    # the hash depends on the location, so it must be recomputed if the location changes
+
+    @property
+    def collector(self) -> Optional[str]:
+        return self._collector
+
+    @collector.setter
+    def collector(self, collector: Optional[str]) -> None:
+        self._collector = collector
+        self._hash = None
+
+    @property
+    def scheduler(self) -> Optional[str]:
+        return self._scheduler
+
+    @scheduler.setter
+    def scheduler(self, scheduler: Optional[str]) -> None:
+        self._scheduler = scheduler
+        self._hash = None
+
     @property
     def constraint_string(self) -> str:
         raise NotImplementedError
@@ -52,19 +94,35 @@ class Handle(abc.ABC, utils.SlotPickleMixin):
         return f"{self.__class__.__name__}(constraint = {self.constraint_string})"
 
     def __eq__(self, other):
-        return all(
-            (
-                isinstance(other, self.__class__),
-                self.constraint_string == other.constraint_string,
-                self.collector == other.collector,
-                self.scheduler == other.scheduler,
-            )
+        if self is other:
+            return True
+        return (
+            isinstance(other, self.__class__)
+            and self.collector == other.collector
+            and self.scheduler == other.scheduler
+            and self.constraint_string == other.constraint_string
         )
 
     def __hash__(self):
-        return hash(
-            (self.__class__, self.constraint_string, self.collector, self.scheduler)
-        )
+        if self._hash is None:
+            self._hash = hash(
+                (self.__class__, self.constraint_string, self.collector, self.scheduler)
+            )
+        return self._hash
+
+    def __getstate__(self):
+        state = super().__getstate__()
+
+        # string hashes are salted per-process, so the cached hash can't be reused
+        state["_hash"] = None
+
+        return state
+
+    def __setstate__(self, state):
+        # handles pickled by older versions don't carry the cached hash slot
+        self._hash = None
+
+        super().__setstate__(state)
 
     @property
     def schedd(self):
@@ -95,26 +153,35 @@ class Handle(abc.ABC, utils.SlotPickleMixin):
             An iterator over the :class:`classad.ClassAd` that match the constraint.
         """
         if projection is None:
-            projection = []
+            projection = _ALL_ATTRIBUTES
 
         if options is None:
-            options = htcondor.QueryOpts.Default
+            options = _DEFAULT_QUERY_OPTS
 
         if limit is None:
             limit = -1
 
         cs = self.constraint_string
+        schedd = self.schedd
         logger.info(
-            f"Executing query against schedd {self.schedd} with constraint {cs}, projection {projection}, and limit {limit}"
+            "Executing query against schedd %s with constraint %s, projection %s, and limit %s",
+            schedd,
+            cs,
+            projection,
+            limit,
         )
-        return self.schedd.xquery(cs, projection=projection, opts=options, limit=limit)
+        return schedd.xquery(cs, projection=projection, opts=options, limit=limit)
 
     def _act(self, action: htcondor.JobAction) -> classad.ClassAd:
         cs = self.constraint_string
+        schedd = self.schedd
         logger.info(
-            f"Executing action {action} against schedd {self.schedd} with constraint {cs}"
+            "Executing action %s against schedd %s with constraint %s",
+            action,
+            schedd,
+            cs,
         )
-        return self.schedd.act(action, cs)
+        return schedd.act(action, cs)
 
     def remove(self) -> classad.ClassAd:
         """
@@ -185,7 +252,7 @@ class Handle(abc.ABC, utils.SlotPickleMixin):
         """
         return self._act(htcondor.JobAction.Vacate)
 
-    def edit(self, attr: str, value: Union[str, int, float]) -> classad.ClassAd:
+    def edit(self, attr: str, value: T_EDIT_VALUE) -> classad.ClassAd:
         """
         Edit attributes of jobs.
 
@@ -208,11 +275,50 @@ class Handle(abc.ABC, utils.SlotPickleMixin):
         ad : :class:`classad.ClassAd`
             An ad describing the results of the edit.
         """
+        return self._edit(self.schedd, attr, value)
+
+    def edit_many(
+        self, edits: Mapping[str, T_EDIT_VALUE]
+    ) -> Dict[str, classad.ClassAd]:
+        """
+        Edit several attributes of jobs at once.
+        All of the edits are made in a single transaction with the schedd.
+        If a :class:`Transaction` is already open with the same schedd,
+        the edits are made as part of it.
+        See :meth:`ConstraintHandle.edit` for caveats.
+
+        Parameters
+        ----------
+        edits
+            A mapping of attributes to their new values.
+
+        Returns
+        -------
+        ads : Dict[str, :class:`classad.ClassAd`]
+            A dictionary mapping each attribute to an ad describing the results of its edit.
+        """
+        schedd = self.schedd
+        # extend any transaction that is already open on this (cached) schedd, instead of failing
+        with schedd.transaction(continue_txn=True):
+            return {
+                attr: self._edit(schedd, attr, value) for attr, value in edits.items()
+            }
+
+    def _edit(
+        self, schedd: htcondor.Schedd, attr: str, value: T_EDIT_VALUE
+    ) -> classad.ClassAd:
         cs = self.constraint_string
         logger.info(
-            f"Executing edit {attr} = {value} against schedd {self.schedd} with constraint {cs}"
+            "Executing edit %s = %s against schedd %s with constraint %s",
+            attr,
+            value,
+            schedd,
+            cs,
         )
-        return self.schedd.edit(cs, attr, str(value))
+        # the schedd parses strings into expressions, so ExprTrees can go straight through
+        if not isinstance(value, classad.ExprTree):
+            value = str(value)
+        return schedd.edit(cs, attr, value)
 
 
 class ConstraintHandle(Handle):
@@ -221,7 +327,7 @@ class ConstraintHandle(Handle):
     The handle can be used to query, act on, or edit those jobs.
     """
 
-    __slots__ = ("_constraint",)
+    __slots__ = ("_constraint", "_constraint_string")
 
     def __init__(
         self,
@@ -232,8 +338,9 @@ class ConstraintHandle(Handle):
         super().__init__(collector=collector, scheduler=scheduler)
 
         if isinstance(constraint, str):
-            constraint = classad.ExprTree(constraint)
+            constraint = _parse_constraint(constraint)
         self._constraint = constraint
+        self._constraint_string: Optional[str] = None
 
     @property
     def constraint(self) -> classad.ExprTree:
@@ -241,10 +348,19 @@ class ConstraintHandle(Handle):
 
     @property
     def constraint_string(self) -> str:
-        return str(self.constraint)
+        # the constraint can't change after construction, so only stringify it once
+        if self._constraint_string is None:
+            self._constraint_string = str(self._constraint)
+        return self._constraint_string
 
     def __repr__(self):
-        return f"{self.__class__.__name__}(constraint = {self.constraint})"
+        return f"{self.__class__.__name__}(constraint = {self.constraint_string})"
+
+    def __setstate__(self, state):
+        # handles pickled by older versions don't carry the cached constraint string slot
+        self._constraint_string = None
+
+        super().__setstate__(state)
 
     def __and__(
         self, other: Union["ConstraintHandle", classad.ExprTree, str]
@@ -256,51 +372,78 @@ class ConstraintHandle(Handle):
     ) -> "ConstraintHandle":
         return self._combine(other, classad.ExprTree.or_)
 
+    @staticmethod
+    def all_of(
+        *constraints: Union["ConstraintHandle", classad.ExprTree, str]
+    ) -> "ConstraintHandle":
+        """
+        Combine handles, expressions, or constraint strings with ``&&``.
+        Equivalent to ``a & b & c & ...``, but without building the intermediate handles.
+        """
+        return _combine_many(constraints, classad.ExprTree.and_)
+
+    @staticmethod
+    def any_of(
+        *constraints: Union["ConstraintHandle", classad.ExprTree, str]
+    ) -> "ConstraintHandle":
+        """
+        Combine handles, expressions, or constraint strings with ``||``.
+        Equivalent to ``a | b | c | ...``, but without building the intermediate handles.
+        """
+        return _combine_many(constraints, classad.ExprTree.or_)
+
     def _combine(
         self, other: Union["ConstraintHandle", classad.ExprTree, str], combinator
     ):
-        if isinstance(other, ConstraintHandle) and (
-            self.collector != other.collector or self.scheduler != other.scheduler
-        ):
-            raise exceptions.InvalidHandle(
-                "Cannot construct a handle for separate schedds"
-            )
+        return _combine_many((self, other), combinator)
 
-        if isinstance(other, ConstraintHandle):
-            c = other.constraint
-        elif isinstance(other, classad.ExprTree):
-            c = other
-        elif isinstance(other, str):
-            c = classad.ExprTree(other)
-        else:
-            raise exceptions.InvalidHandle(
-                f"Cannot construct a combined handle from {self} and {other} because it is not a ConstraintHandle, ExprTree, or cannot be parsed into an ExprTree"
-            )
-
-        return ConstraintHandle(
-            combinator(self.constraint, c),
+    def to_json(self) -> dict:
+        """Return a JSON-formatted dictionary that describes the :class:`ConstraintHandle`."""
+        return dict(
+            type="ConstraintHandle",
+            constraint=self.constraint_string,
             collector=self.collector,
             scheduler=self.scheduler,
         )
 
+    @classmethod
+    def from_json(cls, json: dict) -> "ConstraintHandle":
+        """Return a :class:`ConstraintHandle` from the dictionary produced by :meth:`ConstraintHandle.to_json`."""
+        return cls(
+            json["constraint"], collector=json["collector"], scheduler=json["scheduler"]
+        )
+
     def save(self, path: Path, protocol: Optional[int] = None) -> None:
         """
         Save this :class:`ConstraintHandle` to a file at ``path`` for later use (see :meth:`ConstraintHandle.load`).
+        The handle is stored as JSON (see :meth:`ConstraintHandle.to_json`).
 
         Parameters
         ----------
         path
             The path to save the handle to.
         protocol
-            The `Pickle protocol version <https://docs.python.org/3/library/pickle.html#data-stream-format>`_ to use.
+            Ignored. Handles used to be saved as pickles; this argument selected the
+            pickle protocol. It is deprecated and will be removed in a future release.
         """
-        with path.open(mode="wb") as f:
-            pickle.dump(self, f, protocol=protocol)
+        if protocol is not None:
+            warnings.warn(
+                "the protocol argument to save() is ignored, because handles are now saved as JSON; it will be removed in a future release",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
+        path.write_text(json.dumps(self.to_json()))
 
     @classmethod
     def load(cls, path: Path) -> "ConstraintHandle":
         """
         Load a :class:`ConstraintHandle` from a file at ``path`` that was created by :meth:`ConstraintHandle.save`.
+        The loaded handle has the type of the handle that was saved,
+        which may be a subclass of the class this method is called on.
+        Files containing pickled handles, as written by older versions of :meth:`ConstraintHandle.save`,
+        can still be loaded, but doing so is deprecated;
+        re-save the loaded handle to convert the file to JSON.
 
         Parameters
         ----------
@@ -312,13 +455,121 @@ class ConstraintHandle(Handle):
         handle :
             The loaded handle.
         """
-        with path.open(mode="rb") as f:
-            return pickle.load(f)
+        data = path.read_bytes()
+
+        # saved handles are JSON objects; no pickle starts with a brace
+        if data.lstrip().startswith(b"{"):
+            try:
+                handle_json = json.loads(data.decode("utf-8"))
+            except ValueError as e:  # covers both UnicodeDecodeError and JSONDecodeError
+                raise exceptions.InvalidHandle(
+                    f"{path} does not contain a valid saved handle"
+                ) from e
+            return _handle_from_json(cls, handle_json, path)
+
+        try:
+            handle = pickle.loads(data)
+        except (pickle.UnpicklingError, EOFError) as e:
+            raise exceptions.InvalidHandle(
+                f"{path} does not contain a valid saved handle"
+            ) from e
+
+        warnings.warn(
+            f"{path} contains a pickled handle; loading pickled handles is deprecated and will be removed in a future release (re-save the handle to convert it to JSON)",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return handle
+
+
+def _handle_from_json(
+    cls: Type[ConstraintHandle], handle_json: Any, path: Path
+) -> ConstraintHandle:
+    if not isinstance(handle_json, dict):
+        raise exceptions.InvalidHandle(f"{path} does not contain a saved handle")
+
+    type_name = handle_json.get("type", None)
+    handle_type: Optional[Type[ConstraintHandle]]
+    if type_name is None:
+        # files saved before the type was recorded can only be read as the requested type
+        handle_type = cls
+    else:
+        handle_type = _HANDLE_TYPES.get(type_name, None)
+        if handle_type is None:
+            raise exceptions.InvalidHandle(
+                f"{path} contains an unknown handle type {type_name}"
+            )
+        # subclasses of the saved type can only be recognized by the class load was called on
+        if issubclass(cls, handle_type):
+            handle_type = cls
+        elif not issubclass(handle_type, cls):
+            raise exceptions.InvalidHandle(
+                f"{path} contains a {type_name}, which cannot be loaded as a {cls.__name__}"
+            )
+
+    try:
+        return handle_type.from_json(handle_json)
+    except KeyError as e:
+        raise exceptions.InvalidHandle(
+            f"{path} does not contain a saved {handle_type.__name__} (missing {e})"
+        ) from e
+
+
+def _combine_many(
+    constraints: Iterable[Union[ConstraintHandle, classad.ExprTree, str]],
+    combinator: Callable[[classad.ExprTree, classad.ExprTree], classad.ExprTree],
+) -> ConstraintHandle:
+    constraints = tuple(constraints)
+    if len(constraints) == 0:
+        raise exceptions.InvalidHandle(
+            "Cannot construct a combined handle from nothing"
+        )
+
+    locations = {
+        (c.collector, c.scheduler)
+        for c in constraints
+        if isinstance(c, ConstraintHandle)
+    }
+    if len(locations) > 1:
+        raise exceptions.InvalidHandle("Cannot construct a handle for separate schedds")
+    collector, scheduler = locations.pop() if len(locations) != 0 else (None, None)
+
+    return ConstraintHandle(
+        functools.reduce(combinator, (_as_exprtree(c) for c in constraints)),
+        collector=collector,
+        scheduler=scheduler,
+    )
+
+
+def _as_exprtree(
+    constraint: Union[ConstraintHandle, classad.ExprTree, str],
+) -> classad.ExprTree:
+    if isinstance(constraint, ConstraintHandle):
+        return constraint._constraint
+    elif isinstance(constraint, classad.ExprTree):
+        return constraint
+    elif isinstance(constraint, str):
+        return _parse_constraint(constraint)
+
+    raise exceptions.InvalidHandle(
+        f"Cannot construct a combined handle from {constraint} because it is not a ConstraintHandle, ExprTree, or cannot be parsed into an ExprTree"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_constraint(constraint: str) -> classad.ExprTree:
+    # the same constraint strings tend to be used over and over,
+    # and handles never modify their ExprTrees, so the parsed trees can be shared
+    return classad.ExprTree(constraint)
 
 
 COMPACT_STATE_SWITCHOVER_SIZE = 100_000
 
 
+def _all_complete(handle: "ClusterHandle") -> bool:
+    return handle.state.all_complete()
+
+
 class ClusterHandle(ConstraintHandle):
     """
     A subclass of :class:`ConstraintHandle` that targets a single cluster of jobs,
@@ -340,16 +591,59 @@ class ClusterHandle(ConstraintHandle):
         collector: Optional[str] = None,
         scheduler: Optional[str] = None,
     ):
-        self._clusterid = submit_result.cluster()
-        self._clusterad = submit_result.clusterad()
-        self._first_proc = submit_result.first_proc()
-        self._num_procs = submit_result.num_procs()
+        self._init_from_parts(
+            clusterid=submit_result.cluster(),
+            clusterad=submit_result.clusterad(),
+            first_proc=submit_result.first_proc(),
+            num_procs=submit_result.num_procs(),
+            collector=collector,
+            scheduler=scheduler,
+        )
+
+    @classmethod
+    def _from_parts(
+        cls,
+        clusterid: int,
+        clusterad: Union[classad.ClassAd, str],
+        first_proc: int,
+        num_procs: int,
+        collector: Optional[str] = None,
+        scheduler: Optional[str] = None,
+    ) -> "ClusterHandle":
+        """Build a :class:`ClusterHandle` directly from the pieces of a submit result."""
+        handle = cls.__new__(cls)
+        handle._init_from_parts(
+            clusterid=clusterid,
+            clusterad=clusterad,
+            first_proc=first_proc,
+            num_procs=num_procs,
+            collector=collector,
+            scheduler=scheduler,
+        )
+        return handle
 
+    def _init_from_parts(
+        self,
+        clusterid: int,
+        clusterad: Union[classad.ClassAd, str],
+        first_proc: int,
+        num_procs: int,
+        collector: Optional[str],
+        scheduler: Optional[str],
+    ) -> None:
+        self._clusterid = clusterid
+        self._clusterad = clusterad
+        self._first_proc = first_proc
+        self._num_procs = num_procs
+
+        constraint_string = f"ClusterID == {clusterid}"
         super().__init__(
-            constraint=classad.ExprTree(f"ClusterID == {self.clusterid}"),
+            constraint=classad.ExprTree(constraint_string),
             collector=collector,
             scheduler=scheduler,
         )
+        # we already know exactly what the constraint looks like
+        self._constraint_string = constraint_string
 
         # must delay this until after init, because at this point the submit
         # transaction may not be done yet
@@ -371,7 +665,10 @@ class ClusterHandle(ConstraintHandle):
         return self._clusterid
 
     @property
-    def clusterad(self):
+    def clusterad(self) -> classad.ClassAd:
+        # handles restored from JSON or a pickle hold the unparsed ad until it's needed
+        if isinstance(self._clusterad, str):
+            self._clusterad = classad.parseOne(self._clusterad)
         return self._clusterad
 
     @property
@@ -396,6 +693,7 @@ class ClusterHandle(ConstraintHandle):
         condition: Callable[["ClusterHandle"], bool] = None,
         timeout: Optional[Union[int, float]] = None,
         test_delay: Union[int, float] = 0.25,
+        max_test_delay: Union[int, float] = 5,
     ) -> float:
         """
         Wait for some condition to be satisfied.
@@ -405,7 +703,7 @@ class ClusterHandle(ConstraintHandle):
         .. code:: python
 
             handle.wait(
-                condition = lambda hnd: hnd.state.is_complete()
+                condition = lambda hnd: hnd.state.all_complete()
             )
 
         Where possible, for increased efficiency, use :class:`ClusterState` methods or
@@ -424,37 +722,67 @@ class ClusterHandle(ConstraintHandle):
             :class:`exceptions.WaitedTooLong` exception.
             **The ``condition`` will always be checked at least once, even if ``timeout <= 0``**.
         test_delay
-            The amount of time to wait between test loops.
+            The initial amount of time to wait between test loops.
+            The delay doubles after each unsuccessful test, up to ``max_test_delay``.
+            When using the default condition, the delay drops back to ``test_delay``
+            whenever the job status counts change.
+        max_test_delay
+            The maximum amount of time to wait between test loops.
 
         Returns
         -------
         elapsed_time :
             The amount of time spent waiting.
         """
+        # with the default condition we know what progress looks like,
+        # so we can go back to testing quickly whenever the jobs are changing
+        track_progress = condition is None
         if condition is None:
-            condition = lambda hnd: hnd.state.all_complete()
+            condition = _all_complete
+
+        max_test_delay = max(test_delay, max_test_delay)
+        delay = test_delay
+        last_counts = None
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = None if timeout is None else start_time + timeout
         while not condition(self):
-            if timeout is not None and time.time() > start_time + timeout:
-                raise exceptions.Timeout(
-                    f"waited too long for handle {self} to satisfy {condition}"
-                )
-            time.sleep(test_delay)
-        return time.time() - start_time
+            if track_progress:
+                counts = self.state.counts()
+                if counts != last_counts:
+                    delay = test_delay
+                    last_counts = counts
+
+            if deadline is None:
+                time.sleep(delay)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise exceptions.Timeout(
+                        f"waited too long for handle {self} to satisfy {condition}"
+                    )
+                # don't oversleep the timeout just because the delay has grown large
+                time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_test_delay)
+        return time.monotonic() - start_time
 
     def __getstate__(self):
         state = super().__getstate__()
 
         state["_state"] = None  # remove state tracker
 
+        # the string form of the ad is compact and doesn't depend on the bindings' pickle support;
+        # it is parsed again on first access to clusterad
+        state["_clusterad"] = str(self._clusterad)
+
         return state
 
     def to_json(self) -> dict:
         """Return a JSON-formatted dictionary that describes the :class:`ClusterHandle`."""
         return dict(
+            type="ClusterHandle",
             clusterid=self.clusterid,
-            clusterad=str(self.clusterad),
+            clusterad=str(self._clusterad),
             first_proc=self.first_proc,
             num_procs=len(self),
             collector=self.collector,
@@ -464,39 +792,18 @@ class ClusterHandle(ConstraintHandle):
     @classmethod
     def from_json(cls, json: dict):
         """Return a :class:`ClusterHandle` from the dictionary produced by :meth:`ClusterHandle.to_json`."""
-        submit_result = _MockSubmitResult(
+        return cls._from_parts(
             clusterid=json["clusterid"],
-            clusterad=classad.parseOne(json["clusterad"]),
+            clusterad=json["clusterad"],
             first_proc=json["first_proc"],
             num_procs=json["num_procs"],
+            collector=json["collector"],
+            scheduler=json["scheduler"],
         )
 
-        return cls(
-            submit_result, collector=json["collector"], scheduler=json["scheduler"]
-        )
-
-
-class _MockSubmitResult:
-    """
-    This class is used purely to transform unpacked submit results back into
-    "submit results" to accommodate the :class:`ClusterHandle` constructor.
-    **Should not be used in user code.**
-    """
 
-    def __init__(self, clusterid, clusterad, first_proc, num_procs):
-        self._clusterid = clusterid
-        self._clusterad = clusterad
-        self._first_proc = first_proc
-        self._num_procs = num_procs
-
-    def cluster(self):
-        return self._clusterid
-
-    def clusterad(self):
-        return self._clusterad
-
-    def first_proc(self):
-        return self._first_proc
-
-    def num_procs(self):
-        return self._num_procs
+# the types that can be recovered from the "type" entry written by to_json
+_HANDLE_TYPES: Dict[str, Type[ConstraintHandle]] = {
+    "ConstraintHandle": ConstraintHandle,
+    "ClusterHandle": ClusterHandle,
+}
@@ -13,71 +13,108 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Any, Union, TypeVar, Generic, Dict
+from typing import Optional, Any, Union, TypeVar, Generic
 import logging
 
 import time
-import collections.abc
+import collections
+import threading
 
 import htcondor
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 K = TypeVar("K")
 V = TypeVar("V")
 
 
 class TimedCacheItem(Generic[V]):
-    __slots__ = ("timestamp", "value")
+    __slots__ = ("expires_at", "value")
 
-    def __init__(self, value: V):
-        self.timestamp = time.time()
+    def __init__(self, value: V, expires_at: float):
+        self.expires_at = expires_at
         self.value = value
 
 
-class TimedCache(collections.abc.MutableMapping, Generic[K, V]):
+class TimedCache(Generic[K, V]):
     """
     As a dictionary, except that the entries expire after a specified amount of time.
+    Only the handful of dictionary operations that the schedd cache needs are provided.
+    Access is serialized by a lock, so the cache can be shared between threads.
     """
 
-    __slots__ = ("cache_time", "cache")
+    __slots__ = ("cache_time", "max_size", "cache", "lock")
 
-    def __init__(self, *, cache_time: Union[int, float]):
+    def __init__(
+        self, *, cache_time: Union[int, float], max_size: Optional[int] = None
+    ):
         """
         Parameters
         ----------
         cache_time
             The amount of time to store entries for, in seconds.
+        max_size
+            The maximum number of entries to store.
+            When full, the oldest entries are evicted first.
+            If ``None`` (the default), the size is not limited.
         """
         self.cache_time = cache_time
-        self.cache: Dict[K, TimedCacheItem[V]] = {}
+        self.max_size = max_size
+        self.cache: "collections.OrderedDict[K, TimedCacheItem[V]]" = (
+            collections.OrderedDict()
+        )
+        self.lock = threading.Lock()
 
     def __setitem__(self, key: K, value: V) -> None:
-        self.cache[key] = TimedCacheItem(value)
+        with self.lock:
+            now = time.monotonic()
 
-    def __getitem__(self, key: K) -> V:
-        item = self.cache[key]
-        if self._is_item_expired(item):
-            del self[key]
-            raise KeyError(f"key {key} found, but has expired")
-        return item.value
+            # entries that are never read again would otherwise never be removed,
+            # so sweep out the expired ones whenever something new comes in
+            cache = self.cache
+            for k in [k for k, item in cache.items() if now >= item.expires_at]:
+                del cache[k]
+
+            cache.pop(key, None)  # re-inserting moves the key to the newest position
+            cache[key] = TimedCacheItem(value, now + self.cache_time)
 
-    def _is_item_expired(self, item: TimedCacheItem[V]) -> bool:
-        return time.time() > (item.timestamp + self.cache_time)
+            if self.max_size is not None:
+                while len(cache) > self.max_size:
+                    cache.popitem(last=False)
+
+    def __getitem__(self, key: K) -> V:
+        with self.lock:
+            item = self.cache[key]
+            # monotonic, so that changes to the system clock can't expire entries early or late
+            if time.monotonic() >= item.expires_at:
+                del self.cache[key]
+                raise KeyError(f"key {key} found, but has expired")
+            return item.value
 
     def __delitem__(self, key: K) -> None:
-        del self.cache[key]
+        with self.lock:
+            del self.cache[key]
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
 
     def __iter__(self):
-        yield from self.cache
+        return iter(self.cache)
 
     def __len__(self):
         return len(self.cache)
 
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
 
 # note for testing: the cache is cleared before every test in tests/conftest.py
-SCHEDD_CACHE: TimedCache = TimedCache(cache_time=60)
+SCHEDD_CACHE: TimedCache = TimedCache(cache_time=60, max_size=128)
 
 
 def get_schedd(
@@ -110,6 +147,8 @@ def get_schedd(
 def _locate_schedd(
     collector: Optional[str], scheduler: Optional[str]
 ) -> htcondor.Schedd:
+    logger.debug("Locating schedd %s through collector %s", scheduler, collector)
+
     if scheduler is None:
         return htcondor.Schedd()
 
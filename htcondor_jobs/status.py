@@ -28,7 +28,6 @@ import htcondor
 from . import handles, utils, exceptions
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 
 class JobStatus(enum.IntEnum):
@@ -86,6 +85,7 @@ class ClusterState:
         "_offset",
         "_event_log_path",
         "_events",
+        "_log_size",
         "_data",
         "_counts",
     )
@@ -105,44 +105,81 @@ class ClusterState:
         self._event_log_path = Path(raw_event_log_path).absolute()
 
         self._events = None
+        self._log_size = None
 
         self._data = self._make_initial_data(handle)
-        self._counts = collections.Counter(JobStatus(js) for js in self._data)
+        # every job starts out unmaterialized, so there's no need to count them
+        self._counts = collections.Counter({JobStatus.UNMATERIALIZED: len(self._data)})
 
     def _make_initial_data(self, handle: "handles.ClusterHandle") -> MutableSequence:
-        return [JobStatus.UNMATERIALIZED for _ in range(len(handle))]
+        return [JobStatus.UNMATERIALIZED] * len(handle)
 
     def _update(self):
-        logger.debug(f"triggered status update for handle {self._handle}")
+        logger.debug("triggered status update for handle %s", self._handle)
+
+        # once every job has finished, no later event can change their states
+        if self._num_finished() == len(self._data):
+            return
+
+        # event logs are only ever appended to, so if the file hasn't grown
+        # there can't be any new events to read
+        try:
+            log_size = self._event_log_path.stat().st_size
+        except OSError:
+            log_size = None
+        if log_size is not None and log_size == self._log_size:
+            return
+        self._log_size = log_size
 
         if self._events is None:
             logger.debug(
-                f"looking for event log for handle {self._handle} at {self._event_log_path}"
+                "looking for event log for handle %s at %s",
+                self._handle,
+                self._event_log_path,
             )
             self._events = htcondor.JobEventLog(self._event_log_path.as_posix()).events(
                 0
             )
             logger.debug(
-                f"initialized event log reader for handle {self._handle}, targeting {self._event_log_path}"
+                "initialized event log reader for handle %s, targeting %s",
+                self._handle,
+                self._event_log_path,
             )
 
+        # bind everything the loop touches to locals,
+        # since a large cluster can produce a great many events
+        transitions_get = JOB_EVENT_STATUS_TRANSITIONS.get
+        clusterid = self._clusterid
+        offset = self._offset
+        data = self._data
+        counts = self._counts
+
+        # the events iterator is persistent and picks up where it left off,
+        # so each update only reads the events written since the last one
         for event in self._events:
-            if event.cluster != self._clusterid:
+            if event.cluster != clusterid:
                 continue
 
-            new_status = JOB_EVENT_STATUS_TRANSITIONS.get(event.type, None)
+            new_status = transitions_get(event.type)
             if new_status is not None:
-                key = event.proc - self._offset
+                key = event.proc - offset
 
                 # update counts
-                old_status = self._data[key]
-                self._counts[old_status] -= 1
-                self._counts[new_status] += 1
+                counts[data[key]] -= 1
+                counts[new_status] += 1
 
                 # set new status on individual job
-                self._data[key] = new_status
+                data[key] = new_status
+
+        # nothing more will be read once every job has finished,
+        # so let go of the reader (and its open file) right away
+        if self._num_finished() == len(data):
+            self._events = None
 
-        logger.debug(f"new status counts for {self._handle}: {self._counts}")
+        logger.debug("new status counts for %s: %s", self._handle, self._counts)
+
+    def _num_finished(self) -> int:
+        return self._counts[JobStatus.COMPLETED] + self._counts[JobStatus.REMOVED]
 
     @update_before
     def __getitem__(self, proc: Union[int, slice]) -> JobStatus:
@@ -159,9 +196,17 @@ class ClusterState:
         """
         return self._counts.copy()
 
+    @update_before
+    def count(self, status: JobStatus) -> int:
+        """
+        Return the number of jobs in the given :class:`JobStatus`.
+        Unlike :meth:`ClusterState.counts`, this does not copy the underlying counts.
+        """
+        return self._counts[status]
+
     @update_before
     def __iter__(self):
-        yield from self._data
+        return iter(self._data)
 
     @update_before
     def __str__(self):
@@ -183,7 +228,7 @@ class ClusterState:
         Note that this definition includes jobs that have left the queue,
         not just ones that are in the "Completed" state in the queue.
         """
-        return self.counts()[JobStatus.COMPLETED] == len(self)
+        return self.count(JobStatus.COMPLETED) == len(self)
 
     def any_complete(self) -> bool:
         """
@@ -191,19 +236,19 @@ class ClusterState:
         Note that this definition includes jobs that have left the queue,
         not just ones that are in the "Completed" state in the queue.
         """
-        return self.counts()[JobStatus.COMPLETED] > 0
+        return self.count(JobStatus.COMPLETED) > 0
 
     def any_idle(self) -> bool:
         """Return ``True`` if **any** of the jobs in the cluster are idle."""
-        return self.counts()[JobStatus.IDLE] > 0
+        return self.count(JobStatus.IDLE) > 0
 
     def any_running(self) -> bool:
         """Return ``True`` if **any** of the jobs in the cluster are running."""
-        return self.counts()[JobStatus.RUNNING] > 0
+        return self.count(JobStatus.RUNNING) > 0
 
     def any_held(self) -> bool:
         """Return ``True`` if **any** of the jobs in the cluster are held."""
-        return self.counts()[JobStatus.HELD] > 0
+        return self.count(JobStatus.HELD) > 0
 
 
 class CompactClusterState(ClusterState):
@@ -221,7 +266,7 @@ class CompactClusterState(ClusterState):
     __slots__ = ()
 
     def _make_initial_data(self, handle: "handles.ClusterHandle") -> MutableSequence:
-        return array.array("B", [JobStatus.UNMATERIALIZED for _ in range(len(handle))])
+        return array.array("B", [JobStatus.UNMATERIALIZED]) * len(handle)
 
     def __getitem__(self, proc: int):
         return JobStatus(super().__getitem__(proc))
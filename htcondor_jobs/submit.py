@@ -17,13 +17,13 @@ from typing import Optional, Union, List, Iterable, Mapping, Sequence, TypeVar
 import logging
 
 import collections.abc
+import threading
 
 import htcondor
 
 from . import descriptions, handles, locate, exceptions
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 T_ITEMDATA = Union[str, int, float]
 T_ITEMDATA_MAPPING = Mapping[str, T_ITEMDATA]
@@ -44,6 +44,9 @@ def submit(
     Submit a single cluster of jobs based on a submit description.
     If you are submitting many clusters at once,
     you should do so on a single :class:`Transaction`.
+    If this is called inside an open :class:`Transaction` for the same
+    ``collector`` and ``scheduler``, the jobs are submitted on that transaction
+    instead of a new one.
 
     Parameters
     ----------
@@ -61,12 +64,38 @@ def submit(
     handle : :class:`ClusterHandle`
         A handle connected to the jobs that were submitted.
     """
+    active = _get_active_transaction(collector, scheduler)
+    if active is not None:
+        return active.submit(description, count, itemdata)
+
     with Transaction(collector=collector, scheduler=scheduler) as txn:
         handle = txn.submit(description, count, itemdata)
 
     return handle
 
 
+# the transactions that are currently open in each thread, innermost last
+_ACTIVE_TRANSACTIONS = threading.local()
+
+
+def _get_transaction_stack() -> List["Transaction"]:
+    try:
+        return _ACTIVE_TRANSACTIONS.stack
+    except AttributeError:
+        _ACTIVE_TRANSACTIONS.stack = []
+        return _ACTIVE_TRANSACTIONS.stack
+
+
+def _get_active_transaction(
+    collector: Optional[str], scheduler: Optional[str]
+) -> Optional["Transaction"]:
+    for txn in reversed(_get_transaction_stack()):
+        if txn.collector == collector and txn.scheduler == scheduler:
+            return txn
+
+    return None
+
+
 class Transaction:
     __slots__ = ("collector", "scheduler", "_schedd", "_txn")
 
@@ -120,7 +149,12 @@ class Transaction:
         )
 
         logger.info(
-            f"Submitted {repr(sub)} to {self._schedd} on transaction {self._txn} with count {count}{itemdata_msg}"
+            "Submitted %r to %s on transaction %s with count %s%s",
+            sub,
+            self._schedd,
+            self._txn,
+            count,
+            itemdata_msg,
         )
 
         return handle
@@ -130,9 +164,13 @@ class Transaction:
         self._txn = self._schedd.transaction()
         self._txn.__enter__()
 
+        _get_transaction_stack().append(self)
+
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        _get_transaction_stack().remove(self)
+
         self._txn.__exit__(exc_type, exc_val, exc_tb)
 
 
@@ -13,9 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Any, Mapping, Iterable
+from typing import Optional, Any, Mapping, Iterable, Tuple
 
 import enum
+import functools
 
 
 class StrEnum(str, enum.Enum):
@@ -28,17 +29,12 @@ class SlotPickleMixin:
     __slots__ = ()
 
     def __getstate__(self):
-        # get all the __slots__ in the inheritance tree
-        # if any class has a __dict__, it will be included! no special case needed
-        slots = sum((getattr(c, "__slots__", ()) for c in self.__class__.__mro__), ())
-
         state = dict(
-            (slot, getattr(self, slot)) for slot in slots if hasattr(self, slot)
+            (slot, getattr(self, slot))
+            for slot in _pickleable_slots(self.__class__)
+            if hasattr(self, slot)
         )
 
-        # __weakref__ should always be removed from the state dict
-        state.pop("__weakref__", None)
-
         return state
 
     def __setstate__(self, state: Mapping):
@@ -46,6 +42,16 @@ class SlotPickleMixin:
             object.__setattr__(self, slot, value)
 
 
+@functools.lru_cache(maxsize=None)
+def _pickleable_slots(cls: type) -> Tuple[str, ...]:
+    # get all the __slots__ in the inheritance tree
+    # if any class has a __dict__, it will be included! no special case needed
+    slots = sum((getattr(c, "__slots__", ()) for c in cls.__mro__), ())
+
+    # __weakref__ should always be removed from the state dict
+    return tuple(slot for slot in slots if slot != "__weakref__")
+
+
 def chain_get(mapping: Mapping, keys: Iterable[str], default: Optional[Any] = None):
     """
     As Mapping.get(key, default), except that it will try multiple keys before returning the default.
@@ -16,6 +16,8 @@
 import pytest
 import os
 
+import classad
+
 import htcondor_jobs as jobs
 from htcondor_jobs.locate import SCHEDD_CACHE
 
@@ -47,3 +49,24 @@ def short_sleep(tmp_path):
         arguments="1s",
         log=(tmp_path / "events.log").as_posix(),
     )
+
+
+@pytest.fixture(scope="function")
+def make_cluster_handle():
+    """Build a ClusterHandle without submitting anything."""
+
+    def make(
+        clusterid=1,
+        clusterad=None,
+        first_proc=0,
+        num_procs=1,
+        handle_type=jobs.ClusterHandle,
+    ):
+        return handle_type._from_parts(
+            clusterid=clusterid,
+            clusterad=classad.ClassAd() if clusterad is None else clusterad,
+            first_proc=first_proc,
+            num_procs=num_procs,
+        )
+
+    return make
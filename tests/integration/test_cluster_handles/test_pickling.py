@@ -15,13 +15,14 @@
 
 import pytest
 import time
+import pickle
 
 import htcondor_jobs as jobs
 
 
 @pytest.fixture(scope="function")
 def roundtripped_handle(short_sleep, tmp_path):
-    path = tmp_path / "handle.pkl"
+    path = tmp_path / "handle.json"
     a = jobs.submit(short_sleep)
 
     a.save(path)
@@ -43,3 +44,12 @@ def test_states_are_same(roundtripped_handle):
     a.wait(timeout=180)
 
     assert list(a.state) == list(b.state)
+
+
+def test_pickle_roundtrip_keeps_clusterad(short_sleep):
+    a = jobs.submit(short_sleep)
+
+    b = pickle.loads(pickle.dumps(a))
+
+    assert a == b
+    assert a.clusterad["UserLog"] == b.clusterad["UserLog"]
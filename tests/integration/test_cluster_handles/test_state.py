@@ -43,6 +43,14 @@ def test_hold_count(long_sleep, tmp_path):
     assert handle.state.counts()[jobs.JobStatus.HELD] == 1
 
 
+def test_hold_count_single_status(long_sleep):
+    handle = jobs.submit(long_sleep, count=1)
+
+    handle.hold()
+
+    assert handle.state.count(jobs.JobStatus.HELD) == 1
+
+
 def test_is_complete(short_sleep):
     handle = jobs.submit(short_sleep, count=1)
 
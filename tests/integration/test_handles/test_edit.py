@@ -29,3 +29,21 @@ def test_change_request_memory(long_sleep):
     handle.edit("RequestMemory", 12345)
 
     assert get_job_attr(handle, "RequestMemory") == 12345
+
+
+def test_edit_many(long_sleep):
+    handle = jobs.submit(long_sleep, count=1)
+
+    handle.edit_many({"RequestMemory": 12345, "RequestDisk": 54321})
+
+    assert get_job_attr(handle, "RequestMemory") == 12345
+    assert get_job_attr(handle, "RequestDisk") == 54321
+
+
+def test_edit_many_inside_transaction(long_sleep):
+    with jobs.Transaction() as txn:
+        handle = txn.submit(long_sleep, count=1)
+        handle.edit_many({"RequestMemory": 12345, "RequestDisk": 54321})
+
+    assert get_job_attr(handle, "RequestMemory") == 12345
+    assert get_job_attr(handle, "RequestDisk") == 54321
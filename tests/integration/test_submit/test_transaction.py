@@ -0,0 +1,37 @@
+# Copyright 2019 HTCondor Team, Computer Sciences Department,
+# University of Wisconsin-Madison, WI.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import htcondor_jobs as jobs
+
+
+def test_submit_inside_transaction_uses_that_transaction(long_sleep):
+    with jobs.Transaction() as txn:
+        a = txn.submit(long_sleep, count=1)
+        b = jobs.submit(long_sleep, count=1)
+
+    num_jobs = len(list((a | b).query()))
+
+    assert num_jobs == 2
+
+
+def test_submit_outside_transaction_opens_its_own(long_sleep):
+    with jobs.Transaction():
+        pass
+
+    handle = jobs.submit(long_sleep, count=1)
+
+    assert len(list(handle.query())) == 1
@@ -16,6 +16,8 @@
 import pytest
 
 import operator
+import pickle
+import json
 
 import classad
 
@@ -72,3 +74,199 @@ def test_cannot_combine_handle_with_other_types(
 
     with pytest.raises(jobs.exceptions.InvalidHandle):
         combined = combinator(dummy_constraint_handle, c)
+
+
+def test_constraint_string_is_cached(dummy_constraint_handle):
+    cs = dummy_constraint_handle.constraint_string
+
+    assert dummy_constraint_handle.constraint_string is cs
+
+
+def test_constraint_string_survives_pickling(dummy_constraint_handle):
+    cs = dummy_constraint_handle.constraint_string
+
+    loaded = pickle.loads(pickle.dumps(dummy_constraint_handle))
+
+    assert loaded.constraint_string == cs
+
+
+def test_state_without_cache_slots_can_be_restored():
+    # handles pickled by older versions only carried these slots
+    loaded = jobs.ConstraintHandle.__new__(jobs.ConstraintHandle)
+    loaded.__setstate__(
+        {
+            "collector": None,
+            "scheduler": None,
+            "_constraint": classad.ExprTree("foo == bar"),
+        }
+    )
+
+    assert loaded.constraint_string == "foo == bar"
+    assert loaded == jobs.ConstraintHandle("foo == bar")
+    assert hash(loaded) == hash(jobs.ConstraintHandle("foo == bar"))
+    assert "foo == bar" in repr(loaded)
+
+
+def test_equal_handles_have_same_hash():
+    h1 = jobs.ConstraintHandle("foo == bar")
+    h2 = jobs.ConstraintHandle("foo == bar")
+
+    assert h1 == h2
+    assert hash(h1) == hash(h2)
+
+
+def test_changing_location_after_hashing_updates_equality_and_hash():
+    h1 = jobs.ConstraintHandle("foo == bar")
+    h2 = jobs.ConstraintHandle("foo == bar", scheduler="s")
+    hash(h1)
+
+    h1.scheduler = "s"
+
+    assert h1 == h2
+    assert hash(h1) == hash(h2)
+
+
+def test_constraint_handle_equals_cluster_handle_with_same_constraint(
+    make_cluster_handle,
+):
+    cluster_handle = make_cluster_handle(clusterid=5)
+
+    # the == operator asks the subclass first, so check ConstraintHandle's own comparison
+    assert jobs.ConstraintHandle("ClusterID == 5").__eq__(cluster_handle)
+
+
+def test_handles_with_different_constraints_are_not_equal():
+    h1 = jobs.ConstraintHandle("foo == bar")
+    h2 = jobs.ConstraintHandle("fizz == buzz")
+
+    assert h1 != h2
+
+
+def test_save_then_load_is_equal(dummy_constraint_handle, tmp_path):
+    path = tmp_path / "handle.json"
+
+    dummy_constraint_handle.save(path)
+    loaded = jobs.ConstraintHandle.load(path)
+
+    assert loaded == dummy_constraint_handle
+
+
+def test_load_returns_the_saved_handle_type(make_cluster_handle, tmp_path):
+    path = tmp_path / "handle.json"
+    cluster_handle = make_cluster_handle()
+
+    cluster_handle.save(path)
+    loaded = jobs.ConstraintHandle.load(path)
+
+    assert isinstance(loaded, jobs.ClusterHandle)
+    assert loaded == cluster_handle
+    assert len(loaded) == 1
+
+
+def test_cannot_load_constraint_handle_as_cluster_handle(
+    dummy_constraint_handle, tmp_path
+):
+    path = tmp_path / "handle.json"
+
+    dummy_constraint_handle.save(path)
+
+    with pytest.raises(jobs.exceptions.InvalidHandle):
+        jobs.ClusterHandle.load(path)
+
+
+class MyClusterHandle(jobs.ClusterHandle):
+    pass
+
+
+def test_subclass_can_load_what_it_saved(make_cluster_handle, tmp_path):
+    path = tmp_path / "handle.json"
+    handle = make_cluster_handle(handle_type=MyClusterHandle)
+
+    handle.save(path)
+    loaded = MyClusterHandle.load(path)
+
+    assert isinstance(loaded, MyClusterHandle)
+    assert loaded == handle
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b'{"type": "ConstraintHandle", "constraint"', b"not a handle", b""],
+)
+def test_load_corrupt_file_raises_invalid_handle(tmp_path, contents):
+    path = tmp_path / "handle.json"
+    path.write_bytes(contents)
+
+    with pytest.raises(jobs.exceptions.InvalidHandle):
+        jobs.ConstraintHandle.load(path)
+
+
+def test_load_untyped_json_with_missing_keys_raises_invalid_handle(tmp_path):
+    path = tmp_path / "handle.json"
+    path.write_text(json.dumps(dict(constraint="foo == bar")))
+
+    with pytest.raises(jobs.exceptions.InvalidHandle):
+        jobs.ConstraintHandle.load(path)
+
+
+@pytest.mark.parametrize("protocol", [0, pickle.HIGHEST_PROTOCOL])
+def test_can_still_load_pickled_handle(dummy_constraint_handle, tmp_path, protocol):
+    path = tmp_path / "handle.pkl"
+    path.write_bytes(pickle.dumps(dummy_constraint_handle, protocol=protocol))
+
+    with pytest.warns(DeprecationWarning):
+        loaded = jobs.ConstraintHandle.load(path)
+
+    assert loaded == dummy_constraint_handle
+
+
+def test_save_warns_about_ignored_protocol(dummy_constraint_handle, tmp_path):
+    path = tmp_path / "handle.json"
+
+    with pytest.warns(DeprecationWarning):
+        dummy_constraint_handle.save(path, protocol=2)
+
+    assert jobs.ConstraintHandle.load(path) == dummy_constraint_handle
+
+
+def test_json_roundtrip_keeps_location():
+    h = jobs.ConstraintHandle("foo == bar", collector="fizz", scheduler="buzz")
+
+    loaded = jobs.ConstraintHandle.from_json(h.to_json())
+
+    assert loaded == h
+
+
+@pytest.mark.parametrize(
+    "combine, combinator",
+    [
+        (jobs.ConstraintHandle.all_of, operator.and_),
+        (jobs.ConstraintHandle.any_of, operator.or_),
+    ],
+)
+def test_combine_many_matches_chained_combinators(combine, combinator):
+    h1 = jobs.ConstraintHandle("foo == bar")
+    h2 = jobs.ConstraintHandle("fizz == buzz")
+
+    assert combine(h1, h2, "wiz == bang") == combinator(
+        combinator(h1, h2), "wiz == bang"
+    )
+
+
+@pytest.mark.parametrize(
+    "combine", [jobs.ConstraintHandle.all_of, jobs.ConstraintHandle.any_of]
+)
+def test_cannot_combine_many_handles_with_different_collectors(combine):
+    h1 = jobs.ConstraintHandle("foo == bar", collector="foo")
+    h2 = jobs.ConstraintHandle("foo == bar", collector="bar")
+
+    with pytest.raises(jobs.exceptions.InvalidHandle):
+        combine(h1, h2)
+
+
+@pytest.mark.parametrize(
+    "combine", [jobs.ConstraintHandle.all_of, jobs.ConstraintHandle.any_of]
+)
+def test_cannot_combine_nothing(combine):
+    with pytest.raises(jobs.exceptions.InvalidHandle):
+        combine()
@@ -0,0 +1,108 @@
+# Copyright 2019 HTCondor Team, Computer Sciences Department,
+# University of Wisconsin-Madison, WI.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import time
+
+import htcondor_jobs as jobs
+
+
+class FakeClock:
+    """Replaces time.monotonic and time.sleep, so that sleeping just advances the clock."""
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(scope="function")
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture(scope="function")
+def handle(make_cluster_handle):
+    return make_cluster_handle()
+
+
+def satisfied_after(num_tests):
+    tests = []
+
+    def condition(handle):
+        tests.append(handle)
+        return len(tests) >= num_tests
+
+    return condition
+
+
+def never(handle):
+    return False
+
+
+def test_delay_doubles_up_to_max_test_delay(handle, clock):
+    elapsed = handle.wait(condition=satisfied_after(6), test_delay=1, max_test_delay=5)
+
+    assert clock.sleeps == [1, 2, 4, 5, 5]
+    assert elapsed == sum(clock.sleeps)
+
+
+class FakeState:
+    """Reports each of the given status counts in turn, then reports that all jobs are complete."""
+
+    def __init__(self, progress):
+        self.progress = progress
+        self.tests = 0
+
+    def all_complete(self):
+        self.tests += 1
+        return self.tests > len(self.progress)
+
+    def counts(self):
+        return self.progress[self.tests - 1]
+
+
+def test_delay_resets_when_default_condition_sees_progress(handle, clock):
+    idle = {jobs.JobStatus.IDLE: 1}
+    running = {jobs.JobStatus.RUNNING: 1}
+    handle._state = FakeState([idle, idle, idle, running, running])
+
+    handle.wait(test_delay=1, max_test_delay=8)
+
+    assert clock.sleeps == [1, 2, 4, 1, 2]
+
+
+def test_never_sleeps_past_the_timeout(handle, clock):
+    with pytest.raises(jobs.exceptions.Timeout):
+        handle.wait(condition=never, timeout=10, test_delay=1, max_test_delay=5)
+
+    assert clock.sleeps == [1, 2, 4, 3]
+
+
+def test_timeout_is_raised_once_deadline_passes(handle, clock):
+    with pytest.raises(jobs.exceptions.Timeout):
+        handle.wait(condition=never, timeout=0)
+
+    assert clock.sleeps == []
@@ -16,6 +16,7 @@
 import pytest
 
 import time
+import threading
 
 import htcondor_jobs as jobs
 from htcondor_jobs.locate import TimedCache
@@ -37,3 +38,60 @@ def test_cache_timeout():
 
     with pytest.raises(KeyError):
         tc[0]
+
+
+def test_expired_key_is_not_contained():
+    tc = TimedCache(cache_time=0)
+    tc[0] = object()
+
+    assert 0 not in tc
+
+
+def test_clear():
+    tc = TimedCache(cache_time=20)
+    tc[0] = object()
+
+    tc.clear()
+
+    assert len(tc) == 0
+
+
+def test_max_size_evicts_oldest_entry():
+    tc = TimedCache(cache_time=20, max_size=2)
+    tc[0] = object()
+    tc[1] = object()
+    tc[2] = object()
+
+    assert list(tc) == [1, 2]
+
+
+def test_expired_entries_are_swept_on_insert():
+    tc = TimedCache(cache_time=0)
+    tc[0] = object()
+    tc[1] = object()
+
+    assert list(tc) == [1]
+
+
+def test_concurrent_inserts_and_lookups_do_not_raise():
+    tc = TimedCache(cache_time=0.0005, max_size=128)
+    errors = []
+
+    def hammer(offset):
+        try:
+            for i in range(5000):
+                key = (offset + i) % 200
+                try:
+                    tc[key]
+                except KeyError:
+                    tc[key] = object()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=hammer, args=(n * 50,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -0,0 +1,135 @@
+# Copyright 2019 HTCondor Team, Computer Sciences Department,
+# University of Wisconsin-Madison, WI.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import collections
+
+import htcondor
+import classad
+
+import htcondor_jobs as jobs
+
+CLUSTER_ID = 1
+
+
+class FakeEvent:
+    def __init__(self, proc, type):
+        self.cluster = CLUSTER_ID
+        self.proc = proc
+        self.type = type
+
+
+class FakeJobEventLog:
+    """
+    Stands in for :class:`htcondor.JobEventLog`.
+    Events "written" to it are served to every reader,
+    and the backing file grows so that its size changes like a real event log's.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.path.touch()
+
+        self.pending = collections.deque()
+        self.opens = 0
+        self.reads = 0
+
+    def write(self, *events):
+        self.pending.extend(events)
+        with self.path.open(mode="a") as f:
+            f.write("event\n" * len(events))
+
+    def __call__(self, path):
+        self.opens += 1
+        return self
+
+    def events(self, stop_after):
+        return self
+
+    def __iter__(self):
+        self.reads += 1
+        return self
+
+    def __next__(self):
+        try:
+            return self.pending.popleft()
+        except IndexError:
+            raise StopIteration
+
+
+@pytest.fixture(scope="function")
+def event_log(tmp_path, monkeypatch):
+    log = FakeJobEventLog(tmp_path / "events.log")
+    monkeypatch.setattr(htcondor, "JobEventLog", log)
+    return log
+
+
+@pytest.fixture(scope="function")
+def handle(event_log, make_cluster_handle):
+    return make_cluster_handle(
+        clusterid=CLUSTER_ID,
+        clusterad=classad.ClassAd({"UserLog": event_log.path.as_posix()}),
+        num_procs=2,
+    )
+
+
+def submit_both(event_log):
+    event_log.write(
+        FakeEvent(0, htcondor.JobEventType.SUBMIT),
+        FakeEvent(1, htcondor.JobEventType.SUBMIT),
+    )
+
+
+def test_no_read_when_log_size_unchanged(handle, event_log):
+    submit_both(event_log)
+    handle.state.counts()
+    assert event_log.reads == 1
+
+    handle.state.counts()
+
+    assert event_log.reads == 1
+
+
+def test_new_events_are_read_after_log_grows(handle, event_log):
+    submit_both(event_log)
+    assert handle.state.count(jobs.JobStatus.IDLE) == 2
+
+    event_log.write(FakeEvent(0, htcondor.JobEventType.EXECUTE))
+
+    assert handle.state.count(jobs.JobStatus.IDLE) == 1
+    assert handle.state.count(jobs.JobStatus.RUNNING) == 1
+    assert event_log.reads == 2
+
+
+def test_reader_is_released_and_not_reopened_once_all_jobs_finish(handle, event_log):
+    submit_both(event_log)
+    event_log.write(
+        FakeEvent(0, htcondor.JobEventType.JOB_TERMINATED),
+        FakeEvent(1, htcondor.JobEventType.JOB_ABORTED),
+    )
+
+    counts = handle.state.counts()
+
+    assert counts[jobs.JobStatus.COMPLETED] == 1
+    assert counts[jobs.JobStatus.REMOVED] == 1
+    assert handle.state._events is None
+
+    # even if the log keeps growing, there is no reason to look at it again
+    event_log.write(FakeEvent(0, htcondor.JobEventType.SUBMIT))
+    handle.state.counts()
+
+    assert event_log.opens == 1
+    assert event_log.reads == 1
@@ -82,3 +82,35 @@ def test_str(desc):
 
 def test_as_submit_right_type(desc):
     assert isinstance(desc.as_submit(), htcondor.Submit)
+
+
+def test_str_reflects_setitem(desc):
+    str(desc)
+    desc["hello"] = "wizbang"
+
+    assert str(desc) == "foo = 0\nbar = baz\nhello = wizbang"
+
+
+def test_str_reflects_delitem(desc):
+    str(desc)
+    del desc["foo"]
+
+    assert str(desc) == "bar = baz"
+
+
+def test_update(desc):
+    str(desc)
+    desc.update({"foo": "1"}, hello="wizbang")
+
+    assert desc["foo"] == "1"
+    assert str(desc) == "foo = 1\nbar = baz\nhello = wizbang"
+
+
+def test_get(desc):
+    assert desc.get("foo") == "0"
+    assert desc.get("missing", "default") == "default"
+
+
+def test_contains(desc):
+    assert "foo" in desc
+    assert "missing" not in desc
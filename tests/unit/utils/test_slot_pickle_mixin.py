@@ -0,0 +1,53 @@
+# Copyright 2019 HTCondor Team, Computer Sciences Department,
+# University of Wisconsin-Madison, WI.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import pickle
+
+from htcondor_jobs.utils import SlotPickleMixin
+
+
+class Base(SlotPickleMixin):
+    __slots__ = ("a", "__weakref__")
+
+
+class Child(Base):
+    __slots__ = ("b", "c")
+
+
+def test_roundtrip_includes_slots_from_whole_hierarchy():
+    obj = Child()
+    obj.a = 1
+    obj.b = 2
+    obj.c = 3
+
+    loaded = pickle.loads(pickle.dumps(obj))
+
+    assert (loaded.a, loaded.b, loaded.c) == (1, 2, 3)
+
+
+def test_unset_slots_are_skipped():
+    obj = Child()
+    obj.a = 1
+
+    loaded = pickle.loads(pickle.dumps(obj))
+
+    assert loaded.a == 1
+    assert not hasattr(loaded, "b")
+
+
+def test_weakref_is_not_in_state():
+    assert "__weakref__" not in Child().__getstate__()